@@ -3,15 +3,29 @@ AI-Driven Mock Interview System
 Main Flask Application
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session, abort
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from flask_caching import Cache
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 import os
+import hmac
 import json
+import sqlite3
 import random
-import re
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from question_generator import QuestionGenerator
 from evaluator import AnswerEvaluator
 
@@ -19,19 +33,87 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///interview_system.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['CACHE_TYPE'] = os.environ.get('CACHE_TYPE', 'SimpleCache')
+app.config['CACHE_REDIS_URL'] = os.environ.get('CACHE_REDIS_URL')
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_pre_ping': True,
+    'pool_recycle': 1800
+}
+
+# Size the connection pool only for file-backed or server databases; an
+# in-memory SQLite database gets a StaticPool, which rejects these options
+_database_url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+if not (_database_url.get_backend_name() == 'sqlite'
+        and _database_url.database in (None, '', ':memory:')):
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'].update(pool_size=10, max_overflow=20)
+
+# Hash checked against when a login names an unknown user, so that the
+# response takes the same time whether or not the account exists
+_DUMMY_HASH = generate_password_hash('dummy-password')
+
+# JSON helpers for JSON columns; use orjson when installed, stdlib json otherwise
+if ORJSON_AVAILABLE:
+    def _dumps(value):
+        return orjson.dumps(value).decode()
+
+    _loads = orjson.loads
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """Serialize jsonify() responses with orjson"""
+
+        def _orjson_option(self):
+            # Keep the default provider's key sorting and HTTP-date datetimes
+            option = orjson.OPT_PASSTHROUGH_DATETIME
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return option
+
+        def dumps(self, obj, **kwargs):
+            # Callers passing options (e.g. the session serializer) get stdlib json
+            if kwargs:
+                return super().dumps(obj, **kwargs)
+            return orjson.dumps(obj, default=self.default, option=self._orjson_option()).decode()
+
+        def response(self, *args, **kwargs):
+            # The base response() always passes separators/indent to dumps(),
+            # which would route every jsonify() to the stdlib fallback
+            obj = self._prepare_response_obj(args, kwargs)
+            option = self._orjson_option()
+            if (self.compact is None and self._app.debug) or self.compact is False:
+                option |= orjson.OPT_INDENT_2
+            return self._app.response_class(
+                orjson.dumps(obj, default=self.default, option=option) + b'\n',
+                mimetype=self.mimetype
+            )
+
+        def loads(self, s, **kwargs):
+            # The session serializer passes object_hook to untag flashes etc.
+            if kwargs:
+                return super().loads(s, **kwargs)
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+app.config['SQLALCHEMY_ENGINE_OPTIONS'].update(json_serializer=_dumps, json_deserializer=_loads)
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Apply WAL and cache pragmas once per new SQLite connection"""
+    if not isinstance(dbapi_conn, sqlite3.Connection):
+        return
+    cursor = dbapi_conn.cursor()
+    for pragma in ('journal_mode=WAL', 'synchronous=NORMAL', 'cache_size=-64000',
+                   'temp_store=MEMORY', 'foreign_keys=ON'):
+        cursor.execute(f'PRAGMA {pragma}')
+    cursor.close()
 
-# Custom Jinja2 filter for JSON parsing
-@app.template_filter('from_json')
-def from_json_filter(value):
-    """Parse JSON string to Python object"""
-    if isinstance(value, str):
-        try:
-            return json.loads(value)
-        except (json.JSONDecodeError, TypeError):
-            return []
-    return value if isinstance(value, list) else []
 
 db = SQLAlchemy(app)
+cache = Cache(app)
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
@@ -40,6 +122,12 @@ login_manager.login_view = 'login'
 question_generator = QuestionGenerator()
 evaluator = AnswerEvaluator()
 
+# Question generation runs off the request thread
+question_executor = ThreadPoolExecutor(max_workers=4)
+
+# How long an interview may stay 'generating' before its job is presumed lost
+QUESTION_GENERATION_TIMEOUT = timedelta(minutes=10)
+
 
 # Database Models
 class User(UserMixin, db.Model):
@@ -49,14 +137,16 @@ class User(UserMixin, db.Model):
     email = db.Column(db.String(120), unique=True, nullable=False)
     password_hash = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
-    profile = db.relationship('UserProfile', backref='user', uselist=False, cascade='all, delete-orphan')
-    interviews = db.relationship('Interview', backref='user', lazy=True, cascade='all, delete-orphan')
+    profile = db.relationship('UserProfile', back_populates='user', uselist=False, cascade='all, delete-orphan')
+    # Collections raise on lazy access; routes must query or eager-load them explicitly
+    interviews = db.relationship('Interview', back_populates='user', lazy='raise', cascade='all, delete-orphan')
 
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        # check_password_hash compares digests with hmac.compare_digest
+        return check_password_hash(self.password_hash, password or '')
 
 
 class UserProfile(db.Model):
@@ -65,9 +155,10 @@ class UserProfile(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     full_name = db.Column(db.String(100))
     experience_level = db.Column(db.String(50))  # Beginner, Intermediate, Advanced
-    preferred_domains = db.Column(db.Text)  # JSON array of domains
+    preferred_domains = db.Column(db.JSON, default=list)  # Domain names
     total_interviews = db.Column(db.Integer, default=0)
     average_score = db.Column(db.Float, default=0.0)
+    user = db.relationship('User', back_populates='profile')
 
 
 class Domain(db.Model):
@@ -75,31 +166,41 @@ class Domain(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True, nullable=False)
     description = db.Column(db.Text)
-    question_templates = db.Column(db.Text)  # JSON array of question templates
-    difficulty_levels = db.Column(db.Text)  # JSON array of difficulty levels
+    question_templates = db.Column(db.JSON)  # List of question templates
+    difficulty_levels = db.Column(db.JSON)  # List of difficulty levels
 
 
 class Interview(db.Model):
     """Interview session records"""
+    __table_args__ = (
+        # Per-user status counts/averages and the dashboard's recent list
+        db.Index('ix_interview_user_status_started', 'user_id', 'status', 'started_at'),
+        db.Index('ix_interview_user_started', 'user_id', 'started_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     domain = db.Column(db.String(100), nullable=False)
     started_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     completed_at = db.Column(db.DateTime)
-    status = db.Column(db.String(20), default='in_progress')  # in_progress, completed
+    status = db.Column(db.String(20), default='in_progress')  # generating, in_progress, completed, failed
     overall_score = db.Column(db.Float)
-    questions = db.relationship('Question', backref='interview', lazy=True, cascade='all, delete-orphan')
+    user = db.relationship('User', back_populates='interviews')
+    questions = db.relationship('Question', back_populates='interview', lazy='raise', cascade='all, delete-orphan')
 
 
 class Question(db.Model):
     """Interview questions"""
+    __table_args__ = (
+        db.Index('ix_question_interview_order', 'interview_id', 'order_number'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     interview_id = db.Column(db.Integer, db.ForeignKey('interview.id'), nullable=False)
     question_text = db.Column(db.Text, nullable=False)
     question_type = db.Column(db.String(50))  # technical, behavioral, situational
     difficulty = db.Column(db.String(20))  # easy, medium, hard
     order_number = db.Column(db.Integer)
-    answer = db.relationship('Answer', backref='question', uselist=False, cascade='all, delete-orphan')
+    interview = db.relationship('Interview', back_populates='questions')
+    answer = db.relationship('Answer', back_populates='question', uselist=False, cascade='all, delete-orphan')
 
 
 class Answer(db.Model):
@@ -113,9 +214,10 @@ class Answer(db.Model):
     confidence_score = db.Column(db.Float)
     overall_score = db.Column(db.Float)
     feedback = db.Column(db.Text)
-    strengths = db.Column(db.Text)  # JSON array
-    improvements = db.Column(db.Text)  # JSON array
+    strengths = db.Column(db.JSON, default=list)
+    improvements = db.Column(db.JSON, default=list)
     submitted_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    question = db.relationship('Question', back_populates='answer')
 
 
 @login_manager.user_loader
@@ -123,6 +225,31 @@ def load_user(user_id):
     return db.session.get(User, int(user_id))
 
 
+def _is_owner(owner_id):
+    """Check that the current user owns a record, in constant time"""
+    return hmac.compare_digest(str(owner_id).encode(), str(current_user.id).encode())
+
+
+def interview_owner_required(api=False):
+    """Load the interview named in the URL and reject users who do not own it
+
+    The wrapped view receives the Interview object instead of its id. API
+    routes answer with a JSON 403; page routes flash and go to the dashboard.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(interview_id):
+            interview_obj = Interview.query.get_or_404(interview_id)
+            if not _is_owner(interview_obj.user_id):
+                if api:
+                    return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+                flash('Unauthorized access', 'error')
+                return redirect(url_for('dashboard'))
+            return view(interview_obj)
+        return wrapped
+    return decorator
+
+
 # Routes
 @app.route('/')
 def index():
@@ -142,10 +269,14 @@ def register():
         password = data.get('password')
         full_name = data.get('full_name', '')
 
-        if User.query.filter_by(username=username).first():
-            return jsonify({'success': False, 'message': 'Username already exists'}), 400
-
-        if User.query.filter_by(email=email).first():
+        # Check both unique fields in one query so the duplicate-username and
+        # duplicate-email responses take the same path
+        existing = User.query.filter(
+            db.or_(User.username == username, User.email == email)
+        ).first()
+        if existing is not None:
+            if existing.username == username:
+                return jsonify({'success': False, 'message': 'Username already exists'}), 400
             return jsonify({'success': False, 'message': 'Email already registered'}), 400
 
         user = User(username=username, email=email)
@@ -174,11 +305,15 @@ def login():
 
         user = User.query.filter_by(username=username).first()
 
-        if user and user.check_password(password):
+        if user is None:
+            # Burn the same hashing time as a real check to avoid leaking
+            # which usernames exist
+            check_password_hash(_DUMMY_HASH, password or '')
+        elif user.check_password(password):
             login_user(user)
             return jsonify({'success': True, 'message': 'Login successful', 'redirect': url_for('dashboard')})
-        else:
-            return jsonify({'success': False, 'message': 'Invalid username or password'}), 401
+
+        return jsonify({'success': False, 'message': 'Invalid username or password'}), 401
 
     return render_template('login.html')
 
@@ -196,35 +331,101 @@ def logout():
 def dashboard():
     """User dashboard"""
     user_interviews = Interview.query.filter_by(user_id=current_user.id).order_by(Interview.started_at.desc()).limit(10).all()
+    _expire_stale_generation(user_interviews)
     
-    # Calculate statistics
-    total_interviews = Interview.query.filter_by(user_id=current_user.id).count()
-    completed_interviews = Interview.query.filter_by(user_id=current_user.id, status='completed').count()
-    
-    avg_score = db.session.query(db.func.avg(Interview.overall_score)).filter_by(
-        user_id=current_user.id, status='completed'
-    ).scalar() or 0.0
+    # Summary statistics only change when interviews start or complete
+    stats_key = _dashboard_stats_key(current_user.id)
+    stats = cache.get(stats_key)
+    if stats is None:
+        # Calculate statistics in a single pass over the user's interviews
+        is_completed = Interview.status == 'completed'
+        total_interviews, completed_interviews, avg_score = db.session.query(
+            db.func.count(Interview.id),
+            db.func.sum(db.case((is_completed, 1), else_=0)),
+            db.func.avg(db.case((is_completed, Interview.overall_score)))
+        ).filter(Interview.user_id == current_user.id).one()
+        stats = {
+            'total_interviews': total_interviews,
+            'completed_interviews': completed_interviews or 0,
+            'avg_score': round(avg_score or 0.0, 2)
+        }
+        cache.set(stats_key, stats, timeout=60)
 
     return render_template('dashboard.html', 
                          interviews=user_interviews,
-                         total_interviews=total_interviews,
-                         completed_interviews=completed_interviews,
-                         avg_score=round(avg_score, 2))
+                         **stats)
+
+
+def _dashboard_stats_key(user_id):
+    return f'dashboard_stats:{user_id}'
+
+
+def invalidate_domains_cache():
+    """Drop the cached domain listing so the next request reloads it"""
+    cache.delete('domains')
 
 
 @app.route('/domains')
 @login_required
 def domains():
     """Domain selection page"""
-    available_domains = Domain.query.all()
-    if not available_domains:
-        # Initialize default domains if none exist
-        initialize_default_domains()
-        available_domains = Domain.query.all()
+    available_domains = cache.get('domains')
+    if available_domains is None:
+        ensure_default_domains()
+        available_domains = [{
+            'name': domain.name,
+            'description': domain.description
+        } for domain in Domain.query.all()]
+        cache.set('domains', available_domains, timeout=3600)
     
     return render_template('domains.html', domains=available_domains)
 
 
+def _generate_and_store_questions(interview_id, domain_name):
+    """Generate questions for an interview in the background and mark it ready"""
+    with app.app_context():
+        try:
+            questions = question_generator.generate_questions(domain_name, num_questions=5)
+
+            # Insert all questions in one executemany instead of one ORM add per row
+            db.session.bulk_insert_mappings(Question, [{
+                'interview_id': interview_id,
+                'question_text': q_data['text'],
+                'question_type': q_data.get('type', 'technical'),
+                'difficulty': q_data.get('difficulty', 'medium'),
+                'order_number': idx + 1
+            } for idx, q_data in enumerate(questions)])
+            Interview.query.filter_by(id=interview_id).update({'status': 'in_progress'})
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            app.logger.exception('Question generation failed for interview %s', interview_id)
+            Interview.query.filter_by(id=interview_id).update({'status': 'failed'})
+            db.session.commit()
+
+
+def _expire_stale_generation(interviews):
+    """Mark interviews whose question job never finished as failed
+
+    A worker lost to a restart never updates its row, so anything still
+    generating after QUESTION_GENERATION_TIMEOUT is treated as failed.
+    """
+    cutoff = datetime.now(timezone.utc) - QUESTION_GENERATION_TIMEOUT
+    expired = False
+    for interview_obj in interviews:
+        if interview_obj.status != 'generating':
+            continue
+        started_at = interview_obj.started_at
+        if started_at.tzinfo is None:
+            # SQLite hands back naive datetimes for the stored UTC values
+            started_at = started_at.replace(tzinfo=timezone.utc)
+        if started_at < cutoff:
+            interview_obj.status = 'failed'
+            expired = True
+    if expired:
+        db.session.commit()
+
+
 @app.route('/start-interview', methods=['POST'])
 @login_required
 def start_interview():
@@ -232,52 +433,70 @@ def start_interview():
     data = request.get_json()
     domain_name = data.get('domain')
 
-    # Create new interview
-    interview = Interview(user_id=current_user.id, domain=domain_name)
-    db.session.add(interview)
+    # Create new interview; questions are filled in by a background worker
+    values = {'user_id': current_user.id, 'domain': domain_name, 'status': 'generating'}
+    if db.engine.dialect.insert_returning:
+        # INSERT ... RETURNING gives the id without an ORM flush or a refresh after commit
+        interview_id = db.session.execute(
+            insert(Interview).values(**values).returning(Interview.id)
+        ).scalar_one()
+    else:
+        interview = Interview(**values)
+        db.session.add(interview)
+        db.session.flush()
+        interview_id = interview.id
     db.session.commit()
+    cache.delete(_dashboard_stats_key(current_user.id))
 
-    # Generate questions for this interview
-    questions = question_generator.generate_questions(domain_name, num_questions=5)
-    
-    for idx, q_data in enumerate(questions):
-        question = Question(
-            interview_id=interview.id,
-            question_text=q_data['text'],
-            question_type=q_data.get('type', 'technical'),
-            difficulty=q_data.get('difficulty', 'medium'),
-            order_number=idx + 1
-        )
-        db.session.add(question)
-    
-    db.session.commit()
+    question_executor.submit(_generate_and_store_questions, interview_id, domain_name)
 
     return jsonify({
         'success': True,
-        'interview_id': interview.id,
-        'redirect': url_for('interview', interview_id=interview.id)
+        'interview_id': interview_id,
+        'status_url': url_for('interview_status', interview_id=interview_id),
+        'redirect': url_for('interview', interview_id=interview_id)
+    }), 202
+
+
+@app.route('/interview/<int:interview_id>/status')
+@login_required
+@interview_owner_required(api=True)
+def interview_status(interview_obj):
+    """Report whether an interview's questions are ready"""
+    _expire_stale_generation([interview_obj])
+    return jsonify({
+        'success': True,
+        'status': interview_obj.status,
+        'ready': interview_obj.status not in ('generating', 'failed')
     })
 
 
+# Question fields sent to the interview page as JSON
+_QUESTION_DATA_COLUMNS = (
+    Question.id, Question.question_text, Question.question_type,
+    Question.difficulty, Question.order_number
+)
+_QUESTION_DATA_KEYS = tuple(column.key for column in _QUESTION_DATA_COLUMNS)
+
+
 @app.route('/interview/<int:interview_id>')
 @login_required
-def interview(interview_id):
+@interview_owner_required()
+def interview(interview_obj):
     """Interview session page"""
-    interview_obj = Interview.query.get_or_404(interview_id)
-    
-    if interview_obj.user_id != current_user.id:
-        flash('Unauthorized access', 'error')
+    _expire_stale_generation([interview_obj])
+    if interview_obj.status == 'generating':
+        flash('Your interview questions are still being prepared', 'info')
+        return redirect(url_for('dashboard'))
+    if interview_obj.status == 'failed':
+        flash('Could not prepare questions for this interview. Please start a new one.', 'error')
         return redirect(url_for('dashboard'))
 
-    questions = Question.query.filter_by(interview_id=interview_id).order_by(Question.order_number).all()
-    # Convert SQLAlchemy objects to dictionaries for JSON serialization
-    questions_data = [{
-        'id': q.id,
-        'question_text': q.question_text,
-        'question_type': q.question_type,
-        'difficulty': q.difficulty,
-        'order_number': q.order_number
-    } for q in questions]
+    # Select only the serialized columns so no Question objects are built
+    rows = db.session.query(*_QUESTION_DATA_COLUMNS).filter(
+        Question.interview_id == interview_obj.id
+    ).order_by(Question.order_number).all()
+    questions_data = [dict(zip(_QUESTION_DATA_KEYS, row)) for row in rows]
     return render_template('interview.html', interview=interview_obj, questions=questions_data)
 
 
@@ -289,9 +508,15 @@ def submit_answer():
     question_id = data.get('question_id')
     answer_text = data.get('answer_text')
 
-    question = Question.query.get_or_404(question_id)
+    # Fetch the owner id alongside the question rather than lazy-loading the interview
+    row = db.session.query(Question, Interview.user_id).join(Interview).filter(
+        Question.id == question_id
+    ).first()
+    if row is None:
+        abort(404)
+    question, owner_id = row
     
-    if question.interview.user_id != current_user.id:
+    if not _is_owner(owner_id):
         return jsonify({'success': False, 'message': 'Unauthorized'}), 403
 
     # Evaluate the answer
@@ -307,8 +532,8 @@ def submit_answer():
         confidence_score=evaluation['confidence'],
         overall_score=evaluation['overall'],
         feedback=evaluation['feedback'],
-        strengths=json.dumps(evaluation['strengths']),
-        improvements=json.dumps(evaluation['improvements'])
+        strengths=evaluation['strengths'],
+        improvements=evaluation['improvements']
     )
     db.session.add(answer)
     db.session.commit()
@@ -321,135 +546,129 @@ def submit_answer():
 
 @app.route('/complete-interview/<int:interview_id>', methods=['POST'])
 @login_required
-def complete_interview(interview_id):
+@interview_owner_required(api=True)
+def complete_interview(interview_obj):
     """Complete an interview and generate final report"""
-    interview_obj = Interview.query.get_or_404(interview_id)
-    
-    if interview_obj.user_id != current_user.id:
-        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
-
-    # Calculate overall score
-    answers = db.session.query(Answer).join(Question).filter(
-        Question.interview_id == interview_id
-    ).all()
+    # Calculate overall score in SQL rather than loading every answer
+    overall_score = db.session.query(db.func.avg(Answer.overall_score)).join(Question).filter(
+        Question.interview_id == interview_obj.id
+    ).scalar()
 
-    if answers:
-        overall_score = sum([ans.overall_score for ans in answers]) / len(answers)
+    if overall_score is not None:
         interview_obj.overall_score = overall_score
     
     interview_obj.status = 'completed'
     interview_obj.completed_at = datetime.now(timezone.utc)
-    db.session.commit()
 
-    # Update user profile statistics
-    if current_user.profile:
-        current_user.profile.total_interviews = Interview.query.filter_by(
-            user_id=current_user.id, status='completed'
-        ).count()
-        avg_score = db.session.query(db.func.avg(Interview.overall_score)).filter_by(
-            user_id=current_user.id, status='completed'
-        ).scalar() or 0.0
-        current_user.profile.average_score = avg_score
-        db.session.commit()
+    # Update user profile statistics with one UPDATE ... SET (subquery) so the
+    # profile row is never loaded (autoflush makes this interview count)
+    completed = Interview.query.filter_by(user_id=current_user.id, status='completed')
+    UserProfile.query.filter_by(user_id=current_user.id).update({
+        'total_interviews': completed.with_entities(db.func.count(Interview.id)).scalar_subquery(),
+        'average_score': completed.with_entities(
+            db.func.coalesce(db.func.avg(Interview.overall_score), 0.0)
+        ).scalar_subquery()
+    }, synchronize_session=False)
+
+    db.session.commit()
+    cache.delete(_dashboard_stats_key(current_user.id))
 
     return jsonify({
         'success': True,
-        'redirect': url_for('results', interview_id=interview_id)
+        'redirect': url_for('results', interview_id=interview_obj.id)
     })
 
 
 @app.route('/results/<int:interview_id>')
 @login_required
-def results(interview_id):
+@interview_owner_required()
+def results(interview_obj):
     """Interview results and feedback page"""
-    interview_obj = Interview.query.get_or_404(interview_id)
-    
-    if interview_obj.user_id != current_user.id:
-        flash('Unauthorized access', 'error')
-        return redirect(url_for('dashboard'))
-
-    questions = Question.query.filter_by(interview_id=interview_id).order_by(Question.order_number).all()
-    answers_data = []
-    
-    for question in questions:
-        answer = Answer.query.filter_by(question_id=question.id).first()
-        answers_data.append({
-            'question': question,
-            'answer': answer
-        })
+    # Load answers alongside their questions in batches instead of one query per question
+    questions = Question.query.options(selectinload(Question.answer)).filter_by(
+        interview_id=interview_obj.id
+    ).order_by(Question.order_number).all()
+    answers_data = [{
+        'question': question,
+        'answer': question.answer
+    } for question in questions]
 
     return render_template('results.html', interview=interview_obj, answers_data=answers_data)
 
 
+# Default interview domains seeded into an empty database
+DEFAULT_DOMAINS = [
+    {
+        'name': 'IT/Software Engineering',
+        'description': 'Technical interviews for software development roles',
+        'question_templates': [
+            'Explain {topic} in detail',
+            'What is the difference between {concept1} and {concept2}?',
+            'How would you implement {feature}?',
+            'Describe your experience with {technology}',
+            'What are the best practices for {topic}?'
+        ],
+        'difficulty_levels': ['easy', 'medium', 'hard']
+    },
+    {
+        'name': 'HR/Human Resources',
+        'description': 'Behavioral and situational HR interview questions',
+        'question_templates': [
+            'Tell me about yourself',
+            'Describe a time when you {situation}',
+            'How do you handle {challenge}?',
+            'What are your strengths and weaknesses?',
+            'Why do you want to work here?'
+        ],
+        'difficulty_levels': ['easy', 'medium']
+    },
+    {
+        'name': 'Finance',
+        'description': 'Financial analysis and accounting interview questions',
+        'question_templates': [
+            'Explain {financial_concept}',
+            'How would you analyze {scenario}?',
+            'What is the impact of {event} on financial markets?',
+            'Describe your experience with {financial_tool}',
+            'How do you evaluate {investment_type}?'
+        ],
+        'difficulty_levels': ['medium', 'hard']
+    },
+    {
+        'name': 'Management',
+        'description': 'Leadership and management interview questions',
+        'question_templates': [
+            'How do you motivate your team?',
+            'Describe a time you had to make a difficult decision',
+            'How do you handle conflict in the workplace?',
+            'What is your leadership style?',
+            'How do you prioritize tasks and manage time?'
+        ],
+        'difficulty_levels': ['medium', 'hard']
+    }
+]
+
 def initialize_default_domains():
     """Initialize default interview domains"""
-    domains_data = [
-        {
-            'name': 'IT/Software Engineering',
-            'description': 'Technical interviews for software development roles',
-            'question_templates': [
-                'Explain {topic} in detail',
-                'What is the difference between {concept1} and {concept2}?',
-                'How would you implement {feature}?',
-                'Describe your experience with {technology}',
-                'What are the best practices for {topic}?'
-            ],
-            'difficulty_levels': ['easy', 'medium', 'hard']
-        },
-        {
-            'name': 'HR/Human Resources',
-            'description': 'Behavioral and situational HR interview questions',
-            'question_templates': [
-                'Tell me about yourself',
-                'Describe a time when you {situation}',
-                'How do you handle {challenge}?',
-                'What are your strengths and weaknesses?',
-                'Why do you want to work here?'
-            ],
-            'difficulty_levels': ['easy', 'medium']
-        },
-        {
-            'name': 'Finance',
-            'description': 'Financial analysis and accounting interview questions',
-            'question_templates': [
-                'Explain {financial_concept}',
-                'How would you analyze {scenario}?',
-                'What is the impact of {event} on financial markets?',
-                'Describe your experience with {financial_tool}',
-                'How do you evaluate {investment_type}?'
-            ],
-            'difficulty_levels': ['medium', 'hard']
-        },
-        {
-            'name': 'Management',
-            'description': 'Leadership and management interview questions',
-            'question_templates': [
-                'How do you motivate your team?',
-                'Describe a time you had to make a difficult decision',
-                'How do you handle conflict in the workplace?',
-                'What is your leadership style?',
-                'How do you prioritize tasks and manage time?'
-            ],
-            'difficulty_levels': ['medium', 'hard']
-        }
-    ]
-
-    for domain_data in domains_data:
-        domain = Domain(
-            name=domain_data['name'],
-            description=domain_data['description'],
-            question_templates=json.dumps(domain_data['question_templates']),
-            difficulty_levels=json.dumps(domain_data['difficulty_levels'])
-        )
-        db.session.add(domain)
-    
-    db.session.commit()
+    try:
+        # The INSERT runs immediately, so a duplicate surfaces here, not at commit
+        db.session.bulk_insert_mappings(Domain, DEFAULT_DOMAINS)
+        db.session.commit()
+    except IntegrityError:
+        # Another worker seeded the table first
+        db.session.rollback()
+    invalidate_domains_cache()
+
+
+def ensure_default_domains():
+    """Seed the default domains if the domain table is empty"""
+    if db.session.query(Domain.id).first() is None:
+        initialize_default_domains()
 
 
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
-        if Domain.query.count() == 0:
-            initialize_default_domains()
+        ensure_default_domains()
     app.run(debug=True, host='0.0.0.0', port=5000)
 
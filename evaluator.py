@@ -3,88 +3,383 @@ Answer Evaluator Module
 Evaluates user answers using advanced NLP (spaCy) and rule-based scoring
 """
 
+import os
 import re
 import json
 from collections import Counter
+from functools import lru_cache, partial
+from itertools import islice
+import numpy as np
 import spacy
+from spacy.attrs import POS, LEMMA, IS_PUNCT
 from spacy.lang.en.stop_words import STOP_WORDS
+from spacy.symbols import NOUN, VERB, CCONJ, SCONJ
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# The dependency parser is only needed for sentence boundaries, which the
+# much cheaper senter component also provides
+DISABLED_PIPES = ["parser"]
+
+# Components that only provide sentence boundaries
+SENTENCE_PIPES = ("senter", "parser")
+
+# Universal POS ids compared between question and answer in _evaluate_accuracy
+OVERLAP_POS = frozenset([NOUN, VERB])
+
+# Universal POS ids counted as conjunctions by the communication score
+CONJUNCTION_POS = np.array([CCONJ, SCONJ], dtype=np.uint64)
+
+# Number of parsed question Docs kept per evaluator
+QUESTION_DOC_CACHE_SIZE = 512
+
+# Words picked out by the regex keyword fallback
+WORD_PATTERN = re.compile(r'\b\w+\b')
+FALLBACK_STOP_WORDS = frozenset([
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
+    'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were',
+    'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'should', 'could', 'may', 'might', 'must',
+    'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+])
+
+# Only this many leading characters of an answer are run through spaCy; scores
+# stop improving long before it, and it bounds the tagging/parsing cost
+MAX_PARSE_LEN = 2000
+
+
+# Strength and improvement messages in report order; _identify_strengths and
+# _identify_improvements set bit i when message i applies
+STRENGTH_MESSAGES = (
+    "Clear and well-structured response",
+    "Accurate and relevant information",
+    "Effective communication",
+    "Confident expression",
+    "Used specific examples",
+    "Demonstrated technical knowledge"
+)
+IMPROVEMENT_MESSAGES = (
+    "Improve clarity and structure of your response",
+    "Provide more accurate and relevant information",
+    "Enhance communication skills and organization",
+    "Build confidence in your responses",
+    "Provide more detailed answers",
+    "Be more concise while maintaining key points"
+)
+
+
+def _build_message_table(messages, default):
+    """Map every bitmask over messages to the messages it selects (or the default)"""
+    return tuple(
+        tuple(message for bit, message in enumerate(messages) if mask >> bit & 1) or (default,)
+        for mask in range(1 << len(messages))
+    )
+
+
+STRENGTH_TABLE = _build_message_table(STRENGTH_MESSAGES, "Attempted to answer the question")
+IMPROVEMENT_TABLE = _build_message_table(
+    IMPROVEMENT_MESSAGES, "Continue practicing to maintain your strong performance"
+)
+
+
+def _compile_substring_pattern(terms):
+    """Compile terms into a pattern whose findall() lists every substring occurrence
+    
+    The alternation sits in a lookahead so overlapping occurrences are all
+    reported. Longer terms are tried first, so a term that is a prefix of
+    another at the same position is shadowed by it.
+    """
+    alternation = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))')
+
+
+def _doc_similarity(doc, other):
+    """Cosine similarity of two Docs' mean vectors (0.0 if either has none)
+    
+    Same result as Doc.similarity without its per-call checks and warnings;
+    vector norms are cached on each Doc, so cached question Docs pay for
+    theirs only once.
+    """
+    norm = doc.vector_norm * other.vector_norm
+    if norm == 0:
+        return 0.0
+    return float(np.dot(doc.vector, other.vector) / norm)
+
+
+@lru_cache(maxsize=4)
+def load_spacy_model(model_name):
+    """Load a spaCy pipeline once per process and share it between evaluators
+    
+    Calling a Language object is safe from several threads, so one loaded
+    model can serve every request. Raises OSError if the model is missing.
+    """
+    nlp = spacy.load(model_name, disable=DISABLED_PIPES)
+    if "senter" in nlp.component_names:
+        nlp.enable_pipe("senter")
+    else:
+        nlp.enable_pipe("parser")  # Still needed for doc.sents
+    
+    # Optionally shrink the vector table (en_core_web_lg holds ~600 MB of
+    # vectors): keep the most frequent rows, remapping the rest to their
+    # nearest kept neighbour. The table stays float32, since tok2vec layers
+    # that read static vectors only accept float32
+    vector_rows = int(os.environ.get('AIMOCK_SPACY_VECTOR_ROWS', '0'))
+    if 0 < vector_rows < nlp.vocab.vectors.shape[0]:
+        nlp.vocab.prune_vectors(vector_rows)
+    
+    # Run every component and touch the vector table once now, so the first
+    # answer evaluated in a request doesn't pay for lazy initialisation
+    if os.environ.get('AIMOCK_WARMUP', '1') == '1':
+        doc = nlp("I joined Google in 2020. Then I worked on the search team.")
+        doc.vector_norm
+    return nlp
 
 
 class AnswerEvaluator:
     """Evaluates interview answers using advanced NLP (spaCy) and multiple criteria"""
     
-    def __init__(self):
-        # Load spaCy model (try larger models with word vectors first, fallback to smaller)
-        self.nlp = None
-        self.spacy_available = False
-        
-        # Try models in order of preference (larger = better similarity, but slower)
-        models_to_try = [
-            "en_core_web_md",  # Medium model with word vectors (recommended)
-            "en_core_web_lg",  # Large model with word vectors (best accuracy)
-            "en_core_web_sm"    # Small model without word vectors (fallback)
-        ]
-        
-        for model_name in models_to_try:
-            try:
-                self.nlp = spacy.load(model_name)
-                self.spacy_available = True
-                if model_name == "en_core_web_sm":
-                    print(f"Warning: Using {model_name} without word vectors. For better similarity accuracy, install 'en_core_web_md' with: python -m spacy download en_core_web_md")
-                else:
-                    print(f"Loaded spaCy model: {model_name} (with word vectors)")
-                break
-            except OSError:
-                continue
+    __slots__ = (
+        'nlp', 'spacy_available', '_parse_question',
+        'quality_indicators', 'confident_phrases', 'hedging_phrases',
+        'structure_words', 'transition_words',
+        '_indicator_names', '_indicator_categories', '_indicator_automaton',
+        '_indicator_pattern', '_indicator_prefixes',
+        'minimum_length', 'ideal_length', '_length_clarity'
+    )
+    
+    def __init__(self, nlp=None):
+        # Load spaCy model (try larger models with word vectors first, fallback to smaller);
+        # a caller-provided pipeline is used as-is
+        self.nlp = nlp
+        self.spacy_available = nlp is not None
+        
+        if nlp is None:
+            # Try models in order of preference (larger = better similarity, but slower)
+            models_to_try = [
+                "en_core_web_md",  # Medium model with word vectors (recommended)
+                "en_core_web_lg",  # Large model with word vectors (best accuracy)
+                "en_core_web_sm"    # Small model without word vectors (fallback)
+            ]
+            
+            for model_name in models_to_try:
+                try:
+                    self.nlp = load_spacy_model(model_name)
+                    self.spacy_available = True
+                    if model_name == "en_core_web_sm":
+                        print(f"Warning: Using {model_name} without word vectors. For better similarity accuracy, install 'en_core_web_md' with: python -m spacy download en_core_web_md")
+                    else:
+                        print(f"Loaded spaCy model: {model_name} (with word vectors)")
+                    break
+                except OSError:
+                    continue
         
         if not self.spacy_available:
             print("Warning: No spaCy model found. Install with: python -m spacy download en_core_web_md")
         
+        # Questions come from a finite bank, so their Docs are worth caching. They
+        # are only read for vectors, entities and lemmas, so sentence segmentation
+        # is skipped for them (per call, since the pipeline is shared)
+        self._parse_question = None
+        if self.spacy_available:
+            question_disable = [name for name in SENTENCE_PIPES if name in self.nlp.pipe_names]
+            self._parse_question = lru_cache(maxsize=QUESTION_DOC_CACHE_SIZE)(
+                partial(self.nlp, disable=question_disable)
+            )
+        
         self.quality_indicators = {
-            'positive': [
+            'positive': (
                 'experience', 'implemented', 'successful', 'achieved', 'improved',
                 'solved', 'developed', 'managed', 'led', 'collaborated', 'optimized',
                 'analyzed', 'designed', 'delivered', 'exceeded', 'enhanced'
-            ],
-            'negative': [
+            ),
+            'negative': (
                 'didn\'t', 'couldn\'t', 'failed', 'unable', 'lack', 'limited',
                 'struggled', 'difficult', 'problem', 'issue', 'challenge'
-            ],
-            'technical': [
+            ),
+            'technical': (
                 'algorithm', 'architecture', 'framework', 'methodology', 'pattern',
                 'optimization', 'scalability', 'performance', 'security', 'database',
                 'api', 'microservice', 'deployment', 'testing', 'debugging'
-            ],
-            'communication': [
+            ),
+            'communication': (
                 'clearly', 'effectively', 'communicated', 'explained', 'presented',
                 'discussed', 'collaborated', 'coordinated', 'aligned', 'understood'
-            ]
+            )
         }
+        self.confident_phrases = [
+            'i am confident', 'i believe', 'i know', 'i have experience',
+            'i successfully', 'i achieved', 'i implemented', 'i led'
+        ]
+        self.hedging_phrases = ['maybe', 'perhaps', 'i think', 'i guess', 'not sure', 'uncertain']
+        self.structure_words = ['first', 'second', 'then', 'finally', 'additionally', 'however', 'therefore']
+        self.transition_words = frozenset(self.structure_words + ['moreover', 'furthermore', 'consequently'])
+        
+        # Compile every indicator list into one pattern so an answer is scanned once
+        indicator_terms = dict(
+            self.quality_indicators,
+            confident=self.confident_phrases,
+            hedging=self.hedging_phrases,
+            structure=self.structure_words,
+            examples=('example', 'instance', 'experience'),
+            experience_claims=('when i', 'in my experience', 'i have'),
+            details=('example', 'instance', 'case', 'time when')
+        )
+        self._indicator_names = tuple(indicator_terms)
+        self._indicator_categories = {}
+        for category, terms in indicator_terms.items():
+            for term in terms:
+                self._indicator_categories.setdefault(term, []).append(category)
+        if AHOCORASICK_AVAILABLE:
+            # An Aho-Corasick automaton reports every term occurrence in one pass
+            self._indicator_automaton = ahocorasick.Automaton()
+            for term in self._indicator_categories:
+                self._indicator_automaton.add_word(term, term)
+            self._indicator_automaton.make_automaton()
+        else:
+            self._indicator_pattern = _compile_substring_pattern(self._indicator_categories)
+            # A match also implies every term that is its prefix (e.g. 'i have
+            # experience' contains 'i have'), which the pattern shadows
+            self._indicator_prefixes = {
+                term: tuple(other for other in self._indicator_categories if term.startswith(other))
+                for term in self._indicator_categories
+            }
         
         self.minimum_length = 20  # Minimum characters for a good answer
         self.ideal_length = 100   # Ideal answer length
+        
+        # Clarity length bonus for every answer length up to the last one where
+        # it can change; longer answers use the final entry
+        last_length = max(self.minimum_length, self.ideal_length * 2) + 1
+        self._length_clarity = bytes(
+            (length >= self.minimum_length) * 20
+            + (self.minimum_length <= length <= self.ideal_length * 2) * 10
+            for length in range(last_length + 1)
+        )
     
     def evaluate_answer(self, answer_text, question_text, difficulty='medium'):
         """Evaluate an answer and return scores and feedback"""
         if not answer_text or len(answer_text.strip()) < 10:
             return self._generate_failed_evaluation("Answer is too short or empty.")
         
-        answer_lower = answer_text.lower()
-        answer_length = len(answer_text)
+        # Parse each text once and share the Docs across the sub-evaluators
+        answer_doc = question_doc = None
+        if self.spacy_available and self.nlp:
+            answer_doc = self.nlp(answer_text[:MAX_PARSE_LEN])
+            question_doc = self._parse_question(question_text)
+        
+        return self._evaluate_parsed(answer_text, question_text, difficulty, answer_doc, question_doc)
+    
+    def evaluate_answers(self, items, batch_size=None, n_process=1):
+        """Evaluate many (answer_text, question_text, difficulty) items at once
+        
+        All answers are parsed together through nlp.pipe, which is much faster
+        than calling evaluate_answer in a loop; questions go through the
+        question Doc cache. Returns one result per item.
+        """
+        items = list(items)
+        valid = [i for i, (answer_text, _, _) in enumerate(items)
+                 if answer_text and len(answer_text.strip()) >= 10]
+        
+        valid_set = set(valid)
+        
+        docs = {}
+        if self.spacy_available and self.nlp and valid:
+            if batch_size is None:
+                batch_size = int(os.environ.get('AIMOCK_SPACY_BATCH_SIZE', '64'))
+            answer_docs = self.nlp.pipe((items[i][0][:MAX_PARSE_LEN] for i in valid),
+                                        batch_size=batch_size, n_process=n_process)
+            for i, answer_doc in zip(valid, answer_docs):
+                docs[i] = (answer_doc, self._parse_question(items[i][1]))
+        
+        # Cosine similarity of every answer/question pair in one vectorized pass;
+        # if vector shapes differ (e.g. an empty Doc) pairs are scored one by one
+        similarities = {}
+        if docs:
+            indices = list(docs)
+            try:
+                answer_vectors = np.stack([docs[i][0].vector for i in indices])
+                question_vectors = np.stack([docs[i][1].vector for i in indices])
+            except ValueError:
+                pass
+            else:
+                norms = np.linalg.norm(answer_vectors, axis=1) * np.linalg.norm(question_vectors, axis=1)
+                dots = np.einsum('ij,ij->i', answer_vectors, question_vectors)
+                sims = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
+                similarities = dict(zip(indices, sims.tolist()))
+        
+        # Score every valid answer, then clip all sub-scores in one operation
+        scored = []
+        for i in valid:
+            answer_text, question_text, difficulty = items[i]
+            answer_doc, question_doc = docs.get(i, (None, None))
+            scored.append(self._score_parsed(
+                answer_text, question_text, difficulty, answer_doc, question_doc,
+                similarities.get(i)
+            ))
+        evaluations = {}
+        if scored:
+            score_matrix = np.clip(np.array([scores for scores, _ in scored]), 0.0, 100.0)
+            for i, scores, (_, indicator_counts) in zip(valid, score_matrix.tolist(), scored):
+                evaluations[i] = self._build_evaluation(
+                    items[i][0], scores, self._overall_score(*scores), indicator_counts
+                )
+        
+        return [evaluations[i] if i in valid_set
+                else self._generate_failed_evaluation("Answer is too short or empty.")
+                for i in range(len(items))]
+    
+    def _evaluate_parsed(self, answer_text, question_text, difficulty, answer_doc, question_doc):
+        """Score an answer given its (optional) pre-parsed Docs"""
+        scores, indicator_counts = self._score_parsed(
+            answer_text, question_text, difficulty, answer_doc, question_doc
+        )
         
-        # Calculate individual scores
-        clarity_score = self._evaluate_clarity(answer_text, answer_length)
-        accuracy_score = self._evaluate_accuracy(answer_text, question_text, difficulty)
-        communication_score = self._evaluate_communication(answer_text, answer_lower)
-        confidence_score = self._evaluate_confidence(answer_text, answer_lower)
-        
-        # Calculate overall score (weighted average)
-        overall_score = (
-            clarity_score * 0.25 +
-            accuracy_score * 0.30 +
-            communication_score * 0.25 +
-            confidence_score * 0.20
+        # Clamp the four scores and take their weighted average
+        scores = [min(max(score, 0.0), 100.0) for score in scores]
+        overall_score = self._overall_score(*scores)
+        return self._build_evaluation(answer_text, scores, overall_score, indicator_counts)
+    
+    def _overall_score(self, clarity, accuracy, communication, confidence):
+        """Weighted average of the clipped sub-scores
+        
+        Summed left to right in plain floats: a dot product may round
+        differently (79.99999999999999 instead of 80.0), which flips the
+        feedback thresholds.
+        """
+        return (
+            clarity * 0.25 +
+            accuracy * 0.30 +
+            communication * 0.25 +
+            confidence * 0.20
         )
+    
+    def _score_parsed(self, answer_text, question_text, difficulty, answer_doc, question_doc,
+                      similarity=None):
+        """Return the unclipped sub-scores of an answer and its indicator counts"""
+        answer_lower = answer_text.lower()
+        question_lower = question_text.lower()
+        answer_length = len(answer_text)
+        indicator_counts = self._count_indicators(answer_lower)
+        features = self._analyze_doc(answer_doc) if answer_doc is not None else None
+        
+        scores = [
+            self._evaluate_clarity(answer_text, answer_length, features),
+            self._evaluate_accuracy(
+                answer_text, question_text, answer_lower, question_lower, difficulty,
+                indicator_counts, answer_doc, question_doc, similarity
+            ),
+            self._evaluate_communication(indicator_counts, features),
+            self._evaluate_confidence(indicator_counts)
+        ]
+        return scores, indicator_counts
+    
+    def _build_evaluation(self, answer_text, scores, overall_score, indicator_counts):
+        """Turn clipped sub-scores and the overall score into the result dict"""
+        answer_length = len(answer_text)
+        clarity_score, accuracy_score, communication_score, confidence_score = scores
         
         # Generate feedback
         feedback = self._generate_feedback(
@@ -94,7 +389,8 @@ class AnswerEvaluator:
         
         # Identify strengths and improvements
         strengths = self._identify_strengths(
-            clarity_score, accuracy_score, communication_score, confidence_score, answer_lower
+            clarity_score, accuracy_score, communication_score, confidence_score,
+            indicator_counts
         )
         improvements = self._identify_improvements(
             clarity_score, accuracy_score, communication_score, confidence_score, answer_length
@@ -111,74 +407,90 @@ class AnswerEvaluator:
             'improvements': improvements
         }
     
-    def _evaluate_clarity(self, answer_text, answer_length):
+    def _analyze_doc(self, doc):
+        """Collect the token and sentence features used by clarity and communication
+        
+        Token features are computed with NumPy over the Doc's attribute array
+        instead of visiting each token; only distinct lemmas are looked up as
+        strings for the transition word count.
+        """
+        attrs = doc.to_array([POS, IS_PUNCT, LEMMA])
+        pos = attrs[:, 0]
+        lemma_ids, lemma_counts = np.unique(attrs[:, 2], return_counts=True)
+        strings = doc.vocab.strings
+        transition_words = self.transition_words
+        transition_count = sum(
+            count for lemma_id, count in zip(lemma_ids.tolist(), lemma_counts.tolist())
+            if strings[lemma_id].lower() in transition_words
+        )
+        
+        return {
+            'sentence_lengths': [len(sent) for sent in doc.sents],
+            'has_punct': bool(attrs[:, 1].any()),
+            'has_verb': bool((pos == VERB).any()),
+            'has_noun': bool((pos == NOUN).any()),
+            'transition_count': transition_count,
+            'conjunction_count': int(np.isin(pos, CONJUNCTION_POS).sum())
+        }
+    
+    def _evaluate_clarity(self, answer_text, answer_length, features=None):
         """Evaluate clarity of the answer using NLP"""
         score = 50.0  # Base score
         
         # Length check
-        if answer_length >= self.minimum_length:
-            score += 20
-        if self.minimum_length <= answer_length <= self.ideal_length * 2:
-            score += 10
+        length_clarity = self._length_clarity
+        score += length_clarity[min(answer_length, len(length_clarity) - 1)]
         
         # Use spaCy for advanced sentence analysis if available
-        if self.spacy_available and self.nlp:
-            doc = self.nlp(answer_text)
-            sentences = list(doc.sents)
+        if features is not None:
+            sentence_lengths = features['sentence_lengths']
             
             # Sentence structure analysis
-            if len(sentences) > 1:
+            if len(sentence_lengths) > 1:
                 score += 10
             
             # Check sentence complexity (average sentence length)
-            avg_sentence_length = sum(len(sent) for sent in sentences) / len(sentences) if sentences else 0
+            avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths) if sentence_lengths else 0
             if 10 <= avg_sentence_length <= 30:  # Optimal sentence length
                 score += 10
             elif avg_sentence_length > 50:  # Too complex
                 score -= 5
             
             # Check for proper punctuation using spaCy
-            if any(token.is_punct for token in doc):
+            if features['has_punct']:
                 score += 5
             
             # Check grammatical structure (POS tags)
-            has_verbs = any(token.pos_ == "VERB" for token in doc)
-            has_nouns = any(token.pos_ == "NOUN" for token in doc)
-            if has_verbs and has_nouns:
+            if features['has_verb'] and features['has_noun']:
                 score += 5
         else:
-            # Fallback to basic analysis
-            sentences = re.split(r'[.!?]+', answer_text)
-            if len(sentences) > 1:
-                score += 10
-            if any(punct in answer_text for punct in ['.', '!', '?']):
-                score += 5
-        
-        # Check for capitalization
-        if answer_text[0].isupper():
+            # Fallback to basic analysis: splitting on [.!?]+ yields more than
+            # one sentence exactly when the text has any of those marks, so one
+            # check covers both (plain substring tests beat the regex engine here)
+            if '.' in answer_text or '!' in answer_text or '?' in answer_text:
+                score += 15  # Multiple sentences (10) and punctuation (5)
+        
+        # Check for capitalization (plain range compare for ASCII capitals,
+        # the Unicode lookup only for other characters)
+        first_char = answer_text[0]
+        if 'A' <= first_char <= 'Z' or (first_char > '\x7f' and first_char.isupper()):
             score += 5
         
-        return min(score, 100.0)
+        return score
     
-    def _evaluate_accuracy(self, answer_text, question_text, difficulty):
+    def _evaluate_accuracy(self, answer_text, question_text, answer_lower, question_lower,
+                           difficulty, indicator_counts, answer_doc=None, question_doc=None,
+                           similarity=None):
         """Evaluate accuracy and relevance using NLP semantic similarity"""
         score = 40.0  # Base score
         
-        answer_lower = answer_text.lower()
-        question_lower = question_text.lower()
-        
         # Use spaCy for advanced semantic analysis if available
-        if self.spacy_available and self.nlp:
-            answer_doc = self.nlp(answer_text)
-            question_doc = self.nlp(question_text)
-            
+        if answer_doc is not None and question_doc is not None:
             # Semantic similarity using word vectors
             # Check if model has word vectors (md/lg models) for accurate similarity
             try:
-                import warnings
-                with warnings.catch_warnings():
-                    warnings.filterwarnings("ignore", category=UserWarning, message=".*word vectors.*")
-                    similarity = answer_doc.similarity(question_doc)
+                if similarity is None:
+                    similarity = _doc_similarity(answer_doc, question_doc)
                 
                 # Adjust weight based on whether word vectors are available
                 # Models with word vectors (md/lg) give more accurate similarity
@@ -194,40 +506,41 @@ class AnswerEvaluator:
                 # Continue with other scoring methods
             
             # Extract named entities and important terms
-            question_entities = [ent.text.lower() for ent in question_doc.ents]
-            answer_entities = [ent.text.lower() for ent in answer_doc.ents]
+            question_entities = {ent.text.lower() for ent in question_doc.ents}
+            answer_entities = {ent.text.lower() for ent in answer_doc.ents}
             
             # Check entity overlap
-            entity_overlap = len(set(question_entities) & set(answer_entities))
+            entity_overlap = len(question_entities & answer_entities)
             if entity_overlap > 0:
                 score += min(entity_overlap * 5, 15)
             
-            # Extract key nouns and verbs from question
-            question_keywords = [token.lemma_.lower() for token in question_doc 
-                               if token.pos_ in ['NOUN', 'VERB'] and not token.is_stop]
-            answer_keywords = [token.lemma_.lower() for token in answer_doc 
-                             if token.pos_ in ['NOUN', 'VERB'] and not token.is_stop]
+            # Extract key nouns and verbs as lemma hashes; the lemmatizer already
+            # lowercases noun and verb lemmas, so no strings need to be built
+            question_keywords = {token.lemma for token in question_doc
+                                 if token.pos in OVERLAP_POS and not token.is_stop}
+            answer_keywords = {token.lemma for token in answer_doc
+                               if token.pos in OVERLAP_POS and not token.is_stop}
             
             # Check keyword overlap (using lemmatized forms)
-            overlap = len(set(question_keywords) & set(answer_keywords))
+            overlap = len(question_keywords & answer_keywords)
             if overlap > 0:
                 score += min(overlap * 3, 20)
         else:
-            # Fallback to basic keyword extraction
-            question_keywords = self._extract_keywords(question_text)
-            answer_keywords = self._extract_keywords(answer_text)
-            overlap = len(set(question_keywords) & set(answer_keywords))
+            # Fallback to basic keyword extraction (no model loaded, so there
+            # are no Docs) from the already-lowercased texts
+            question_keywords = self._extract_fallback_keywords(question_lower)
+            answer_keywords = self._extract_fallback_keywords(answer_lower)
+            overlap = len(set(question_keywords).intersection(answer_keywords))
             if overlap > 0:
                 score += min(overlap * 10, 30)
         
         # Check for technical terms (for technical questions)
-        if any(word in question_lower for word in ['explain', 'what is', 'difference', 'how']):
-            technical_count = sum(1 for word in self.quality_indicators['technical'] 
-                                if word in answer_lower)
-            score += min(technical_count * 5, 20)
+        if ('explain' in question_lower or 'what is' in question_lower
+                or 'difference' in question_lower or 'how' in question_lower):
+            score += min(indicator_counts['technical'] * 5, 20)
         
         # Check for specific examples or details
-        if any(word in answer_lower for word in ['example', 'instance', 'case', 'time when']):
+        if indicator_counts['details']:
             score += 10
         
         # Difficulty adjustment
@@ -236,108 +549,79 @@ class AnswerEvaluator:
         elif difficulty == 'easy':
             score *= 1.1  # Slightly higher for easy questions
         
-        return min(score, 100.0)
+        return score
     
-    def _evaluate_communication(self, answer_text, answer_lower):
+    def _evaluate_communication(self, indicator_counts, features=None):
         """Evaluate communication quality using NLP"""
         score = 50.0  # Base score
         
         # Use spaCy for advanced communication analysis
-        if self.spacy_available and self.nlp:
-            doc = self.nlp(answer_text)
-            
+        if features is not None:
             # Check for transition words (adverbs and conjunctions)
-            transition_words = ['first', 'second', 'then', 'finally', 'additionally', 
-                              'however', 'therefore', 'moreover', 'furthermore', 'consequently']
-            transition_count = sum(1 for token in doc 
-                                 if token.lemma_.lower() in transition_words)
-            score += min(transition_count * 5, 15)
+            score += min(features['transition_count'] * 5, 15)
             
             # Check for discourse markers (conjunctions)
-            conjunctions = sum(1 for token in doc if token.pos_ == "CCONJ" or token.pos_ == "SCONJ")
+            conjunctions = features['conjunction_count']
             if conjunctions > 0:
                 score += min(conjunctions * 2, 10)
             
             # Check sentence variety (different sentence structures)
-            sentence_lengths = [len(list(sent)) for sent in doc.sents]
+            sentence_lengths = features['sentence_lengths']
             if len(sentence_lengths) > 1:
                 length_variance = max(sentence_lengths) - min(sentence_lengths)
                 if length_variance > 5:  # Good variety
                     score += 5
         
         # Check for communication-related keywords
-        comm_keywords = sum(1 for word in self.quality_indicators['communication'] 
-                          if word in answer_lower)
-        score += min(comm_keywords * 8, 20)
+        score += min(indicator_counts['communication'] * 8, 20)
         
         # Check for structure indicators
-        structure_words = ['first', 'second', 'then', 'finally', 'additionally', 'however', 'therefore']
-        structure_count = sum(1 for word in structure_words if word in answer_lower)
-        score += min(structure_count * 5, 15)
+        score += min(indicator_counts['structure'] * 5, 15)
         
         # Check for positive language
-        positive_count = sum(1 for word in self.quality_indicators['positive'] 
-                           if word in answer_lower)
-        score += min(positive_count * 3, 15)
+        score += min(indicator_counts['positive'] * 3, 15)
         
-        return min(score, 100.0)
+        return score
     
-    def _evaluate_confidence(self, answer_text, answer_lower):
+    def _evaluate_confidence(self, indicator_counts):
         """Evaluate confidence level in the answer"""
         score = 50.0  # Base score
         
         # Check for confident language
-        confident_phrases = [
-            'i am confident', 'i believe', 'i know', 'i have experience',
-            'i successfully', 'i achieved', 'i implemented', 'i led'
-        ]
-        confident_count = sum(1 for phrase in confident_phrases if phrase in answer_lower)
-        score += min(confident_count * 10, 30)
+        score += min(indicator_counts['confident'] * 10, 30)
         
         # Check for hedging language (reduces confidence)
-        hedging_phrases = ['maybe', 'perhaps', 'i think', 'i guess', 'not sure', 'uncertain']
-        hedging_count = sum(1 for phrase in hedging_phrases if phrase in answer_lower)
-        score -= min(hedging_count * 5, 20)
+        score -= min(indicator_counts['hedging'] * 5, 20)
         
         # Check for specific examples (shows confidence through experience)
-        if any(word in answer_lower for word in ['when i', 'in my experience', 'i have']):
+        if indicator_counts['experience_claims']:
             score += 10
         
         # Check for negative language
-        negative_count = sum(1 for word in self.quality_indicators['negative'] 
-                           if word in answer_lower)
-        score -= min(negative_count * 3, 15)
+        score -= min(indicator_counts['negative'] * 3, 15)
         
-        return max(min(score, 100.0), 0.0)
+        return score
     
-    def _extract_keywords(self, text):
-        """Extract important keywords using NLP"""
-        if self.spacy_available and self.nlp:
-            doc = self.nlp(text)
-            # Extract nouns, verbs, and adjectives (excluding stop words)
-            keywords = [token.lemma_.lower() for token in doc 
-                       if token.pos_ in ['NOUN', 'VERB', 'ADJ'] 
-                       and not token.is_stop 
-                       and not token.is_punct
-                       and len(token.text) > 3]
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_keywords = []
-            for kw in keywords:
-                if kw not in seen:
-                    seen.add(kw)
-                    unique_keywords.append(kw)
-            return unique_keywords[:15]  # Return top 15 keywords
+    def _count_indicators(self, text_lower):
+        """Count how many distinct terms of each indicator list occur in the text"""
+        counts = dict.fromkeys(self._indicator_names, 0)
+        if AHOCORASICK_AVAILABLE:
+            found = {term for _, term in self._indicator_automaton.iter(text_lower)}
         else:
-            # Fallback to basic extraction
-            stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 
-                         'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were',
-                         'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
-                         'will', 'would', 'should', 'could', 'may', 'might', 'must',
-                         'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'}
-            words = re.findall(r'\b\w+\b', text.lower())
-            keywords = [w for w in words if w not in stop_words and len(w) > 3]
-            return keywords[:10]  # Return top 10 keywords
+            found = set()
+            for term in set(self._indicator_pattern.findall(text_lower)):
+                found.update(self._indicator_prefixes[term])
+        for term in found:
+            for category in self._indicator_categories[term]:
+                counts[category] += 1
+        return counts
+    
+    def _extract_fallback_keywords(self, text_lower):
+        """Extract keywords from already-lowercased text without NLP"""
+        # Stop scanning as soon as 10 keywords are found instead of listing every word
+        words = (match.group() for match in WORD_PATTERN.finditer(text_lower))
+        keywords = (w for w in words if w not in FALLBACK_STOP_WORDS and len(w) > 3)
+        return list(islice(keywords, 10))  # Return top 10 keywords
     
     def _generate_feedback(self, clarity, accuracy, communication, confidence, overall, answer_text, length):
         """Generate detailed feedback"""
@@ -382,52 +666,27 @@ class AnswerEvaluator:
         
         return " ".join(feedback_parts)
     
-    def _identify_strengths(self, clarity, accuracy, communication, confidence, answer_lower):
+    def _identify_strengths(self, clarity, accuracy, communication, confidence, indicator_counts):
         """Identify strengths in the answer"""
-        strengths = []
-        
-        if clarity >= 70:
-            strengths.append("Clear and well-structured response")
-        if accuracy >= 70:
-            strengths.append("Accurate and relevant information")
-        if communication >= 70:
-            strengths.append("Effective communication")
-        if confidence >= 70:
-            strengths.append("Confident expression")
-        
-        if any(word in answer_lower for word in ['example', 'instance', 'experience']):
-            strengths.append("Used specific examples")
-        
-        if any(word in answer_lower for word in self.quality_indicators['technical']):
-            strengths.append("Demonstrated technical knowledge")
-        
-        if not strengths:
-            strengths.append("Attempted to answer the question")
-        
-        return strengths
+        # One bit per STRENGTH_MESSAGES entry, looked up in a precomputed table
+        mask = ((clarity >= 70)
+                | (accuracy >= 70) << 1
+                | (communication >= 70) << 2
+                | (confidence >= 70) << 3
+                | (indicator_counts['examples'] > 0) << 4
+                | (indicator_counts['technical'] > 0) << 5)
+        return list(STRENGTH_TABLE[mask])
     
     def _identify_improvements(self, clarity, accuracy, communication, confidence, length):
         """Identify areas for improvement"""
-        improvements = []
-        
-        if clarity < 70:
-            improvements.append("Improve clarity and structure of your response")
-        if accuracy < 70:
-            improvements.append("Provide more accurate and relevant information")
-        if communication < 70:
-            improvements.append("Enhance communication skills and organization")
-        if confidence < 70:
-            improvements.append("Build confidence in your responses")
-        
-        if length < self.minimum_length:
-            improvements.append("Provide more detailed answers")
-        elif length > self.ideal_length * 3:
-            improvements.append("Be more concise while maintaining key points")
-        
-        if not improvements:
-            improvements.append("Continue practicing to maintain your strong performance")
-        
-        return improvements
+        # One bit per IMPROVEMENT_MESSAGES entry, looked up in a precomputed table
+        mask = ((clarity < 70)
+                | (accuracy < 70) << 1
+                | (communication < 70) << 2
+                | (confidence < 70) << 3
+                | (length < self.minimum_length) << 4
+                | (length > self.ideal_length * 3 and length >= self.minimum_length) << 5)
+        return list(IMPROVEMENT_TABLE[mask])
     
     def _generate_failed_evaluation(self, reason):
         """Generate evaluation for failed/invalid answers"""
@@ -6,6 +6,7 @@ Generates interview questions using NLP (spaCy) and domain knowledge
 import random
 import json
 import re
+import string
 try:
     import spacy
     SPACY_AVAILABLE = True
@@ -13,144 +14,269 @@ except ImportError:
     SPACY_AVAILABLE = False
 
 
+# Domain-specific knowledge base
+DOMAIN_KNOWLEDGE = {
+    'IT/Software Engineering': {
+        'topics': [
+            'Object-Oriented Programming', 'Data Structures', 'Algorithms',
+            'Database Design', 'RESTful APIs', 'Microservices Architecture',
+            'Cloud Computing', 'DevOps', 'Software Testing', 'Version Control',
+            'Design Patterns', 'System Design', 'Security', 'Performance Optimization'
+        ],
+        'concepts': {
+            'OOP': ['Encapsulation', 'Inheritance', 'Polymorphism', 'Abstraction'],
+            'Data Structures': ['Arrays', 'Linked Lists', 'Stacks', 'Queues', 'Trees', 'Graphs'],
+            'Algorithms': ['Sorting', 'Searching', 'Dynamic Programming', 'Greedy Algorithms'],
+            'Databases': ['SQL', 'NoSQL', 'ACID Properties', 'Normalization', 'Indexing']
+        },
+        'technologies': ['Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Docker', 'Kubernetes']
+    },
+    'HR/Human Resources': {
+        'topics': [
+            'Teamwork', 'Leadership', 'Problem Solving', 'Communication',
+            'Time Management', 'Conflict Resolution', 'Adaptability', 'Work Ethics'
+        ],
+        'situations': [
+            'worked under pressure', 'handled a difficult situation',
+            'led a team project', 'resolved a conflict', 'learned a new skill',
+            'made a mistake', 'achieved a goal', 'worked with a difficult colleague'
+        ],
+        'challenges': [
+            'tight deadlines', 'conflicting priorities', 'team disagreements',
+            'unclear requirements', 'resource constraints'
+        ]
+    },
+    'Finance': {
+        'topics': [
+            'Financial Analysis', 'Investment Banking', 'Risk Management',
+            'Accounting Principles', 'Financial Modeling', 'Market Analysis',
+            'Portfolio Management', 'Corporate Finance'
+        ],
+        'concepts': {
+            'Analysis': ['DCF', 'NPV', 'IRR', 'ROI', 'Financial Ratios'],
+            'Markets': ['Stock Market', 'Bond Market', 'Derivatives', 'Forex'],
+            'Tools': ['Excel', 'Bloomberg', 'Financial Statements', 'Valuation Models']
+        },
+        'scenarios': [
+            'company valuation', 'investment decision', 'risk assessment',
+            'market trend analysis', 'financial planning'
+        ]
+    },
+    'Management': {
+        'topics': [
+            'Leadership', 'Strategic Planning', 'Team Management',
+            'Change Management', 'Decision Making', 'Performance Management'
+        ],
+        'situations': [
+            'leading a team', 'managing a project', 'handling underperformance',
+            'implementing change', 'making strategic decisions'
+        ],
+        'styles': [
+            'Transformational', 'Transactional', 'Servant Leadership',
+            'Democratic', 'Autocratic'
+        ]
+    }
+}
+
+# Question templates for different domains
+QUESTION_TEMPLATES = {
+    'IT/Software Engineering': [
+        "Explain {topic} and its importance in software development.",
+        "What is the difference between {concept1} and {concept2}?",
+        "How would you design a system to handle {scenario}?",
+        "Describe your experience with {technology}. What challenges did you face?",
+        "What are the best practices for implementing {topic}?",
+        "How would you optimize a {component} for better performance?",
+        "Explain the trade-offs between {option1} and {option2}.",
+        "How do you ensure code quality when working with {technology}?",
+        "Describe a time when you had to debug a complex issue related to {topic}.",
+        "What security considerations should be taken when working with {technology}?"
+    ],
+    'HR/Human Resources': [
+        "Tell me about yourself and your professional background.",
+        "Describe a time when you {situation}. What was the outcome?",
+        "How do you handle {challenge} in the workplace?",
+        "What are your greatest strengths and how do they help you in your role?",
+        "Can you share an example of a weakness you've worked on improving?",
+        "Why are you interested in this position and our company?",
+        "How do you prioritize tasks when you have multiple deadlines?",
+        "Describe a situation where you had to work with a difficult team member.",
+        "How do you stay motivated during challenging projects?",
+        "Where do you see yourself in 5 years?"
+    ],
+    'Finance': [
+        "Explain {concept} and its application in financial analysis.",
+        "How would you analyze {scenario} from a financial perspective?",
+        "What factors would you consider when evaluating {investment_type}?",
+        "Describe your experience with {tool} and how you've used it in analysis.",
+        "How do you assess the financial health of a company?",
+        "Explain the impact of {event} on financial markets.",
+        "What is your approach to risk management in {context}?",
+        "How would you present financial data to non-financial stakeholders?",
+        "Describe a time when your financial analysis led to an important decision.",
+        "What trends do you see in the current financial market?"
+    ],
+    'Management': [
+        "How do you motivate and inspire your team members?",
+        "Describe a time when you had to make a difficult decision as a manager.",
+        "How do you handle conflict within your team?",
+        "What is your leadership style and how has it evolved?",
+        "How do you prioritize tasks and manage your team's workload?",
+        "Describe a situation where you had to manage an underperforming team member.",
+        "How do you ensure effective communication within your team?",
+        "What strategies do you use for change management?",
+        "How do you balance the needs of your team with organizational goals?",
+        "Describe your approach to developing and mentoring team members."
+    ]
+}
+
+# Values for placeholders that aren't drawn from the knowledge base
+IT_SCENARIOS = ['high traffic', 'data consistency', 'scalability', 'security']
+IT_COMPONENTS = ['database query', 'API endpoint', 'frontend component', 'algorithm']
+IT_OPTION_PAIRS = [
+    ('SQL', 'NoSQL'),
+    ('Monolithic', 'Microservices'),
+    ('Synchronous', 'Asynchronous'),
+    ('Caching', 'Database queries')
+]
+FINANCE_INVESTMENT_TYPES = ['stocks', 'bonds', 'real estate', 'startups', 'mutual funds']
+FINANCE_EVENTS = ['interest rate changes', 'market volatility', 'economic recession', 'regulatory changes']
+FINANCE_CONTEXTS = ['portfolio management', 'corporate finance', 'investment banking']
+
+# IT concept groups for {concept1}/{concept2} pairs
+IT_CONCEPT_GROUPS = list(DOMAIN_KNOWLEDGE['IT/Software Engineering']['concepts'].values())
+
+# Every Finance concept, flattened once for {concept} placeholders
+FINANCE_CONCEPTS = [concept for concept_list in DOMAIN_KNOWLEDGE['Finance']['concepts'].values()
+                    for concept in concept_list]
+
+
+def _classify_template(template):
+    """Classify a question template as behavioral, situational, technical or general"""
+    template_lower = template.lower()
+    
+    if any(word in template_lower for word in ['describe', 'tell me', 'share', 'time when']):
+        return 'behavioral'
+    elif any(word in template_lower for word in ['how would', 'how do', 'what would']):
+        return 'situational'
+    elif any(word in template_lower for word in ['explain', 'what is', 'difference between']):
+        return 'technical'
+    else:
+        return 'general'
+
+
+# The type of every built-in template, classified once at import
+TEMPLATE_QUESTION_TYPES = {
+    template: _classify_template(template)
+    for templates in QUESTION_TEMPLATES.values()
+    for template in templates
+}
+
+
+def _pick_it_concept_pair(knowledge):
+    """Pick two different concepts from one IT concept group"""
+    concept_pair = random.choice(IT_CONCEPT_GROUPS)
+    if len(concept_pair) >= 2:
+        concept1, concept2 = random.sample(concept_pair, 2)
+        return {'concept1': concept1, 'concept2': concept2}
+    return None
+
+
+def _pick_it_option_pair(knowledge):
+    """Pick a pair of IT options to compare"""
+    option1, option2 = random.choice(IT_OPTION_PAIRS)
+    return {'option1': option1, 'option2': option2}
+
+
+# Placeholder value pickers per domain, in order of precedence: a template is
+# filled by the first picker whose placeholders it contains. Each picker takes
+# the domain's knowledge and returns the values for its placeholders
+PLACEHOLDER_PICKERS = {
+    'IT/Software Engineering': (
+        (('topic',), lambda knowledge: {'topic': random.choice(knowledge['topics'])}),
+        (('concept1', 'concept2'), _pick_it_concept_pair),
+        (('technology',), lambda knowledge: {'technology': random.choice(knowledge['technologies'])}),
+        (('scenario',), lambda knowledge: {'scenario': random.choice(IT_SCENARIOS)}),
+        (('component',), lambda knowledge: {'component': random.choice(IT_COMPONENTS)}),
+        (('option1', 'option2'), _pick_it_option_pair)
+    ),
+    'HR/Human Resources': (
+        (('situation',), lambda knowledge: {'situation': random.choice(knowledge['situations'])}),
+        (('challenge',), lambda knowledge: {'challenge': random.choice(knowledge['challenges'])})
+    ),
+    'Finance': (
+        (('concept',), lambda knowledge: {'concept': random.choice(FINANCE_CONCEPTS)}),
+        (('scenario',), lambda knowledge: {'scenario': random.choice(knowledge['scenarios'])}),
+        (('investment_type',), lambda knowledge: {'investment_type': random.choice(FINANCE_INVESTMENT_TYPES)}),
+        (('tool',), lambda knowledge: {'tool': random.choice(knowledge['concepts']['Tools'])}),
+        (('event',), lambda knowledge: {'event': random.choice(FINANCE_EVENTS)}),
+        (('context',), lambda knowledge: {'context': random.choice(FINANCE_CONTEXTS)})
+    ),
+    'Management': (
+        (('situation',), lambda knowledge: {'situation': random.choice(knowledge['situations'])}),
+    )
+}
+
+
+def _select_picker(domain, template):
+    """Return the placeholder picker that fills a template (None if none applies)"""
+    fields = {name for _, name, _, _ in string.Formatter().parse(template) if name}
+    for placeholders, picker in PLACEHOLDER_PICKERS.get(domain, ()):
+        if fields.issuperset(placeholders):
+            return picker
+    return None
+
+
+# The picker for every built-in template, selected once at import
+TEMPLATE_PICKERS = {
+    (domain, template): _select_picker(domain, template)
+    for domain, templates in QUESTION_TEMPLATES.items()
+    for template in templates
+}
+
+
+class _PlaceholderValues(dict):
+    """format_map() mapping that leaves placeholders it has no value for intact"""
+    
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
 class QuestionGenerator:
     """Generates interview questions using NLP (spaCy) and domain knowledge"""
     
+    __slots__ = ('_nlp', '_nlp_loaded', 'domain_knowledge', 'question_templates')
+    
     def __init__(self):
-        # Load spaCy model if available (try models with word vectors first)
-        self.nlp = None
-        self.spacy_available = False
+        # The spaCy model is loaded on first use of self.nlp; question
+        # generation itself doesn't need it
+        self._nlp = None
+        self._nlp_loaded = False
         
-        if SPACY_AVAILABLE:
-            models_to_try = ["en_core_web_md", "en_core_web_lg", "en_core_web_sm"]
-            for model_name in models_to_try:
-                try:
-                    self.nlp = spacy.load(model_name)
-                    self.spacy_available = True
-                    break
-                except OSError:
-                    continue
-        
-        self.domain_knowledge = self._load_domain_knowledge()
-        self.question_templates = self._load_question_templates()
+        # Shared constants, built once at import rather than per instance
+        self.domain_knowledge = DOMAIN_KNOWLEDGE
+        self.question_templates = QUESTION_TEMPLATES
     
-    def _load_domain_knowledge(self):
-        """Load domain-specific knowledge base"""
-        return {
-            'IT/Software Engineering': {
-                'topics': [
-                    'Object-Oriented Programming', 'Data Structures', 'Algorithms',
-                    'Database Design', 'RESTful APIs', 'Microservices Architecture',
-                    'Cloud Computing', 'DevOps', 'Software Testing', 'Version Control',
-                    'Design Patterns', 'System Design', 'Security', 'Performance Optimization'
-                ],
-                'concepts': {
-                    'OOP': ['Encapsulation', 'Inheritance', 'Polymorphism', 'Abstraction'],
-                    'Data Structures': ['Arrays', 'Linked Lists', 'Stacks', 'Queues', 'Trees', 'Graphs'],
-                    'Algorithms': ['Sorting', 'Searching', 'Dynamic Programming', 'Greedy Algorithms'],
-                    'Databases': ['SQL', 'NoSQL', 'ACID Properties', 'Normalization', 'Indexing']
-                },
-                'technologies': ['Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Docker', 'Kubernetes']
-            },
-            'HR/Human Resources': {
-                'topics': [
-                    'Teamwork', 'Leadership', 'Problem Solving', 'Communication',
-                    'Time Management', 'Conflict Resolution', 'Adaptability', 'Work Ethics'
-                ],
-                'situations': [
-                    'worked under pressure', 'handled a difficult situation',
-                    'led a team project', 'resolved a conflict', 'learned a new skill',
-                    'made a mistake', 'achieved a goal', 'worked with a difficult colleague'
-                ],
-                'challenges': [
-                    'tight deadlines', 'conflicting priorities', 'team disagreements',
-                    'unclear requirements', 'resource constraints'
-                ]
-            },
-            'Finance': {
-                'topics': [
-                    'Financial Analysis', 'Investment Banking', 'Risk Management',
-                    'Accounting Principles', 'Financial Modeling', 'Market Analysis',
-                    'Portfolio Management', 'Corporate Finance'
-                ],
-                'concepts': {
-                    'Analysis': ['DCF', 'NPV', 'IRR', 'ROI', 'Financial Ratios'],
-                    'Markets': ['Stock Market', 'Bond Market', 'Derivatives', 'Forex'],
-                    'Tools': ['Excel', 'Bloomberg', 'Financial Statements', 'Valuation Models']
-                },
-                'scenarios': [
-                    'company valuation', 'investment decision', 'risk assessment',
-                    'market trend analysis', 'financial planning'
-                ]
-            },
-            'Management': {
-                'topics': [
-                    'Leadership', 'Strategic Planning', 'Team Management',
-                    'Change Management', 'Decision Making', 'Performance Management'
-                ],
-                'situations': [
-                    'leading a team', 'managing a project', 'handling underperformance',
-                    'implementing change', 'making strategic decisions'
-                ],
-                'styles': [
-                    'Transformational', 'Transactional', 'Servant Leadership',
-                    'Democratic', 'Autocratic'
-                ]
-            }
-        }
+    @property
+    def nlp(self):
+        """spaCy model, loaded on first access (None if unavailable)"""
+        if not self._nlp_loaded:
+            if SPACY_AVAILABLE:
+                # Try models with word vectors first
+                models_to_try = ["en_core_web_md", "en_core_web_lg", "en_core_web_sm"]
+                for model_name in models_to_try:
+                    try:
+                        self._nlp = spacy.load(model_name)
+                        break
+                    except OSError:
+                        continue
+            self._nlp_loaded = True
+        return self._nlp
     
-    def _load_question_templates(self):
-        """Load question templates for different domains"""
-        return {
-            'IT/Software Engineering': [
-                "Explain {topic} and its importance in software development.",
-                "What is the difference between {concept1} and {concept2}?",
-                "How would you design a system to handle {scenario}?",
-                "Describe your experience with {technology}. What challenges did you face?",
-                "What are the best practices for implementing {topic}?",
-                "How would you optimize a {component} for better performance?",
-                "Explain the trade-offs between {option1} and {option2}.",
-                "How do you ensure code quality when working with {technology}?",
-                "Describe a time when you had to debug a complex issue related to {topic}.",
-                "What security considerations should be taken when working with {technology}?"
-            ],
-            'HR/Human Resources': [
-                "Tell me about yourself and your professional background.",
-                "Describe a time when you {situation}. What was the outcome?",
-                "How do you handle {challenge} in the workplace?",
-                "What are your greatest strengths and how do they help you in your role?",
-                "Can you share an example of a weakness you've worked on improving?",
-                "Why are you interested in this position and our company?",
-                "How do you prioritize tasks when you have multiple deadlines?",
-                "Describe a situation where you had to work with a difficult team member.",
-                "How do you stay motivated during challenging projects?",
-                "Where do you see yourself in 5 years?"
-            ],
-            'Finance': [
-                "Explain {concept} and its application in financial analysis.",
-                "How would you analyze {scenario} from a financial perspective?",
-                "What factors would you consider when evaluating {investment_type}?",
-                "Describe your experience with {tool} and how you've used it in analysis.",
-                "How do you assess the financial health of a company?",
-                "Explain the impact of {event} on financial markets.",
-                "What is your approach to risk management in {context}?",
-                "How would you present financial data to non-financial stakeholders?",
-                "Describe a time when your financial analysis led to an important decision.",
-                "What trends do you see in the current financial market?"
-            ],
-            'Management': [
-                "How do you motivate and inspire your team members?",
-                "Describe a time when you had to make a difficult decision as a manager.",
-                "How do you handle conflict within your team?",
-                "What is your leadership style and how has it evolved?",
-                "How do you prioritize tasks and manage your team's workload?",
-                "Describe a situation where you had to manage an underperforming team member.",
-                "How do you ensure effective communication within your team?",
-                "What strategies do you use for change management?",
-                "How do you balance the needs of your team with organizational goals?",
-                "Describe your approach to developing and mentoring team members."
-            ]
-        }
+    @property
+    def spacy_available(self):
+        """Whether a spaCy model could be loaded"""
+        return self.nlp is not None
     
     def generate_questions(self, domain, num_questions=5, difficulty='medium'):
         """Generate interview questions for a given domain"""
@@ -160,19 +286,15 @@ class QuestionGenerator:
         knowledge = self.domain_knowledge[domain]
         templates = self.question_templates.get(domain, [])
         
-        questions = []
-        used_templates = set()
+        # Select templates without repeats, starting a new round once all
+        # of the domain's templates have been used
+        selected_templates = []
+        while templates and len(selected_templates) < num_questions:
+            round_size = min(num_questions - len(selected_templates), len(templates))
+            selected_templates.extend(random.sample(templates, round_size))
         
-        for i in range(num_questions):
-            # Select a random template
-            available_templates = [t for t in templates if t not in used_templates]
-            if not available_templates:
-                available_templates = templates
-                used_templates.clear()
-            
-            template = random.choice(available_templates)
-            used_templates.add(template)
-            
+        questions = []
+        for template in selected_templates:
             # Fill in the template with domain-specific content
             question_text = self._fill_template(template, domain, knowledge, difficulty)
             
@@ -190,80 +312,19 @@ class QuestionGenerator:
     
     def _fill_template(self, template, domain, knowledge, difficulty):
         """Fill question template with appropriate content"""
-        question = template
-        
-        # Replace placeholders based on domain
-        if domain == 'IT/Software Engineering':
-            if '{topic}' in template:
-                question = question.replace('{topic}', random.choice(knowledge['topics']))
-            elif '{concept1}' in template and '{concept2}' in template:
-                concept_pair = random.choice(list(knowledge['concepts'].values()))
-                if len(concept_pair) >= 2:
-                    concepts = random.sample(concept_pair, 2)
-                    question = question.replace('{concept1}', concepts[0])
-                    question = question.replace('{concept2}', concepts[1])
-            elif '{technology}' in template:
-                question = question.replace('{technology}', random.choice(knowledge['technologies']))
-            elif '{scenario}' in template:
-                scenarios = ['high traffic', 'data consistency', 'scalability', 'security']
-                question = question.replace('{scenario}', random.choice(scenarios))
-            elif '{component}' in template:
-                components = ['database query', 'API endpoint', 'frontend component', 'algorithm']
-                question = question.replace('{component}', random.choice(components))
-            elif '{option1}' in template and '{option2}' in template:
-                options = [
-                    ('SQL', 'NoSQL'),
-                    ('Monolithic', 'Microservices'),
-                    ('Synchronous', 'Asynchronous'),
-                    ('Caching', 'Database queries')
-                ]
-                opt1, opt2 = random.choice(options)
-                question = question.replace('{option1}', opt1)
-                question = question.replace('{option2}', opt2)
+        key = (domain, template)
+        picker = TEMPLATE_PICKERS[key] if key in TEMPLATE_PICKERS else _select_picker(domain, template)
+        values = picker(knowledge) if picker else None
+        if not values:
+            return template
         
-        elif domain == 'HR/Human Resources':
-            if '{situation}' in template:
-                question = question.replace('{situation}', random.choice(knowledge['situations']))
-            elif '{challenge}' in template:
-                question = question.replace('{challenge}', random.choice(knowledge['challenges']))
-        
-        elif domain == 'Finance':
-            if '{concept}' in template:
-                all_concepts = []
-                for concept_list in knowledge['concepts'].values():
-                    all_concepts.extend(concept_list)
-                if all_concepts:
-                    question = question.replace('{concept}', random.choice(all_concepts))
-            elif '{scenario}' in template:
-                question = question.replace('{scenario}', random.choice(knowledge['scenarios']))
-            elif '{investment_type}' in template:
-                investments = ['stocks', 'bonds', 'real estate', 'startups', 'mutual funds']
-                question = question.replace('{investment_type}', random.choice(investments))
-            elif '{tool}' in template:
-                question = question.replace('{tool}', random.choice(knowledge['concepts']['Tools']))
-            elif '{event}' in template:
-                events = ['interest rate changes', 'market volatility', 'economic recession', 'regulatory changes']
-                question = question.replace('{event}', random.choice(events))
-            elif '{context}' in template:
-                contexts = ['portfolio management', 'corporate finance', 'investment banking']
-                question = question.replace('{context}', random.choice(contexts))
-        
-        elif domain == 'Management':
-            if '{situation}' in template:
-                question = question.replace('{situation}', random.choice(knowledge['situations']))
-        
-        return question
+        # Substitute every placeholder in one pass; any without a value stay as-is
+        return template.format_map(_PlaceholderValues(values))
     
     def _determine_question_type(self, template, domain):
         """Determine the type of question"""
-        template_lower = template.lower()
-        
-        if any(word in template_lower for word in ['describe', 'tell me', 'share', 'time when']):
-            return 'behavioral'
-        elif any(word in template_lower for word in ['how would', 'how do', 'what would']):
-            return 'situational'
-        elif any(word in template_lower for word in ['explain', 'what is', 'difference between']):
-            return 'technical'
-        else:
-            return 'general'
+        question_type = TEMPLATE_QUESTION_TYPES.get(template)
+        if question_type is None:
+            question_type = _classify_template(template)
+        return question_type
 
@@ -15,6 +15,7 @@ def check_dependencies():
         import flask_sqlalchemy
         import flask_login
         import werkzeug
+        import flask_caching
         print("✓ All required packages are installed")
         return True
     except ImportError as e:
@@ -26,12 +27,10 @@ def setup_database():
     """Initialize the database"""
     print("\nSetting up database...")
     try:
-        from app import app, db, Domain
+        from app import app, db, ensure_default_domains
         with app.app_context():
             db.create_all()
-            if Domain.query.count() == 0:
-                from app import initialize_default_domains
-                initialize_default_domains()
+            ensure_default_domains()
             print("✓ Database initialized successfully")
             return True
     except Exception as e: